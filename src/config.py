@@ -1,24 +1,44 @@
 """Configuration constants and minimal ABIs for interacting with Curve USDC/crvUSD.
 
 This module keeps addresses, defaults, and ABIs centralized so the main script
-can focus on flow control.
+can focus on flow control. Bound contract objects are cached per Web3 instance,
+so repeated lookups reuse them instead of rebuilding them from the ABI.
 """
 
 from __future__ import annotations
 
+import weakref
+from typing import Dict
+
+from web3 import Web3
+from web3.contract import Contract
+
 DEFAULT_RPC_URL = "http://127.0.0.1:8545"
 ENV_RPC_URL = "RPC_URL"
 ENV_IMPERSONATED_ADDRESS = "IMPERSONATED_ADDRESS"
 ENV_BURN_BPS = "BURN_BPS"
 
+# Addresses are stored checksummed so they can be passed to web3 as-is.
 POOL_ADDRESS = "0x4DEcE678ceceb27446b35C672dC7d61F30bAD69E"
 USDC_ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+# Canonical Multicall3 deployment (same address on mainnet and most EVM chains).
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
 # Use a 1% slippage buffer against the estimated output.
 SLIPPAGE_BPS = 99
 MAX_COINS_CHECK = 4
 MIN_BURN_BPS = 1
 MAX_BURN_BPS = 10_000
+# Upper bound on memoized calc_withdraw_one_coin results (least recently used are evicted).
+ESTIMATE_CACHE_SIZE = 1024
+
+# Hot-path pool calls are encoded by hand: selector + eth_abi-encoded arguments.
+CALC_WITHDRAW_ONE_COIN_SELECTOR = Web3.keccak(text="calc_withdraw_one_coin(uint256,int128)")[:4]
+CALC_WITHDRAW_ONE_COIN_TYPES = ["uint256", "int128"]
+REMOVE_LIQUIDITY_ONE_COIN_SELECTOR = Web3.keccak(text="remove_liquidity_one_coin(uint256,int128,uint256,address)")[:4]
+REMOVE_LIQUIDITY_ONE_COIN_TYPES = ["uint256", "int128", "uint256", "address"]
+# Conservative upper bound for remove_liquidity_one_coin on this pool; skips eth_estimateGas.
+REMOVE_LIQUIDITY_GAS_LIMIT = 500_000
 
 # Minimal ERC-20 ABI (USDC)
 ERC20_ABI = [
@@ -45,7 +65,9 @@ ERC20_ABI = [
     },
 ]
 
-# Minimal ABI for the Curve USDC/crvUSD pool (which is also the LP token)
+# Minimal ABI for the Curve USDC/crvUSD pool (which is also the LP token). The
+# calc_withdraw_one_coin and remove_liquidity_one_coin calls are hand-encoded from
+# the selectors above, so they are deliberately not listed here.
 CURVE_POOL_ABI = [
     {
         "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
@@ -75,38 +97,75 @@ CURVE_POOL_ABI = [
         "stateMutability": "view",
         "type": "function",
     },
+]
+
+# Minimal Multicall3 ABI: tryAggregate, which tolerates reverting subcalls, and
+# getBlockNumber, so an aggregate can report the block it was executed against.
+MULTICALL3_ABI = [
     {
-        "inputs": [
-            {"internalType": "uint256", "name": "_burn_amount", "type": "uint256"},
-            {"internalType": "int128", "name": "i", "type": "int128"},
-        ],
-        "name": "calc_withdraw_one_coin",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"internalType": "uint256", "name": "blockNumber", "type": "uint256"}],
         "stateMutability": "view",
         "type": "function",
     },
     {
         "inputs": [
-            {"internalType": "uint256", "name": "_burn_amount", "type": "uint256"},
-            {"internalType": "int128", "name": "i", "type": "int128"},
-            {"internalType": "uint256", "name": "_min_received", "type": "uint256"},
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]",
+            },
         ],
-        "name": "remove_liquidity_one_coin",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "uint256", "name": "_burn_amount", "type": "uint256"},
-            {"internalType": "int128", "name": "i", "type": "int128"},
-            {"internalType": "uint256", "name": "_min_received", "type": "uint256"},
-            {"internalType": "address", "name": "_receiver", "type": "address"},
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
         ],
-        "name": "remove_liquidity_one_coin",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "nonpayable",
+        "stateMutability": "payable",
         "type": "function",
     },
 ]
 
+
+_ABIS = {
+    "pool": CURVE_POOL_ABI,
+    "erc20": ERC20_ABI,
+    "multicall": MULTICALL3_ABI,
+}
+
+
+# Bound contracts per live Web3 instance; weak keys let a discarded Web3 (and its
+# provider) be garbage collected instead of being pinned by the cache.
+_contracts: weakref.WeakKeyDictionary[Web3, Dict[str, Contract]] = weakref.WeakKeyDictionary()
+
+
+def _contract(w3: Web3, kind: str, address: str) -> Contract:
+    contracts = _contracts.setdefault(w3, {})
+    if kind not in contracts:
+        contracts[kind] = w3.eth.contract(address=address, abi=_ABIS[kind])
+    return contracts[kind]
+
+
+def get_pool_contract(w3: Web3) -> Contract:
+    return _contract(w3, "pool", POOL_ADDRESS)
+
+
+def get_usdc_contract(w3: Web3) -> Contract:
+    return _contract(w3, "erc20", USDC_ADDRESS)
+
+
+def get_multicall_contract(w3: Web3) -> Contract:
+    return _contract(w3, "multicall", MULTICALL3_ADDRESS)
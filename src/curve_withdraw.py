@@ -9,32 +9,69 @@ contracts on a fork—never mainnet directly.
 from __future__ import annotations
 
 import argparse
+import math
 import os
 import sys
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.util.retry import Retry
 from web3 import HTTPProvider, Web3
 from web3.contract import Contract
-from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.middleware import simple_cache_middleware
 
 import src.config as config
 
 console = Console()
 
 
+def build_http_session() -> requests.Session:
+    """Keep-alive session with a small connection pool and a short connect retry."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Content-Type"] = "application/json"
+    return session
+
+
+# Shared by the HTTPProvider and raw batch POSTs so every request reuses one connection.
+http_session = build_http_session()
+
+TRANSFER_TOPIC0 = Web3.keccak(text="Transfer(address,address,uint256)")
+
+# usdc_index per (pool_address, usdc_address); coins() is immutable so a hit skips the RPC.
+_usdc_index_cache: Dict[Tuple[str, str], int] = {}
+
+
 @dataclass
 class Balances:
     lp_balance: int
     usdc_balance: int
+
+
+@dataclass(frozen=True)
+class TokenMeta:
     lp_decimals: int
     usdc_decimals: int
     usdc_symbol: str
 
 
+# TokenMeta per (pool_address, usdc_address); decimals and symbol never change.
+_token_meta_cache: Dict[Tuple[str, str], TokenMeta] = {}
+
+# calc_withdraw_one_coin results per (pool_address, burn_amount, usdc_index, block),
+# bounded to config.ESTIMATE_CACHE_SIZE entries in LRU order.
+_estimate_cache: OrderedDict[Tuple[str, int, int, int], int] = OrderedDict()
+
+
 def parse_args(argv: list[str] | None = None, env: Dict[str, str] | os._Environ[str] = os.environ) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Burn Curve USDC/crvUSD LP tokens and withdraw USDC on a mainnet fork.",
@@ -64,6 +101,11 @@ def parse_args(argv: list[str] | None = None, env: Dict[str, str] | os._Environ[
         action="store_true",
         help="Only estimate outputs and print balances without sending a transaction.",
     )
+    parser.add_argument(
+        "--verify-chain-state",
+        action="store_true",
+        help="Re-read balances from the chain after the withdrawal instead of deriving them from the receipt logs.",
+    )
     args = parser.parse_args(argv)
 
     if not args.impersonated_address:
@@ -76,7 +118,14 @@ def parse_args(argv: list[str] | None = None, env: Dict[str, str] | os._Environ[
 
 
 def get_web3(rpc_url: str) -> Web3:
-    w3 = Web3(HTTPProvider(rpc_url))
+    w3 = Web3(HTTPProvider(rpc_url, session=http_session))
+    # The validation middleware asks for eth_chainId before every eth_call and
+    # transaction; simple_cache_middleware answers repeats of that (and of
+    # net_version and other immutable lookups) from memory after the first call.
+    # Responses are read by key, so the AttributeDict wrapping is unnecessary work.
+    w3.middleware_onion.add(simple_cache_middleware)
+    w3.middleware_onion.remove("attrdict")
+    # Probe once here; later failures surface from the real RPC calls.
     if not w3.is_connected():
         sys.exit(f"Failed to connect to RPC at {rpc_url}. Is your local fork running?")
     return w3
@@ -89,57 +138,210 @@ def to_checksum(w3: Web3, address: str) -> str:
         sys.exit(f"Invalid Ethereum address provided: {address}. Error: {exc}")
 
 
-def impersonate_and_fund(w3: Web3, impersonated: str, funding_account: str, fund_eth: float = 0.1) -> None:
-    """Impersonate the LP holder on a local fork and optionally top up gas.
+def impersonate_and_fund(w3: Web3, impersonated: str, fund_eth: float = 0.1) -> None:
+    """Impersonate the LP holder on a local fork and give it ETH for gas.
+
+    Both Anvil calls go out in one batched POST; anvil_setBalance credits the
+    account directly (replacing its ETH balance) instead of sending a funding
+    transaction. Impersonation is only safe on a fork; never attempt this
+    against real mainnet.
+    """
+    try:
+        rpc_batch(
+            w3,
+            [
+                ("anvil_impersonateAccount", [impersonated]),
+                ("anvil_setBalance", [impersonated, hex(w3.to_wei(fund_eth, "ether"))]),
+            ],
+        )
+    except (ValueError, requests.RequestException) as exc:
+        sys.exit(f"RPC error during impersonation: {exc}")
+    console.print(f"[green]Impersonation successful[/green]; set {impersonated} balance to {fund_eth} ETH.")
+
+
+def rpc_batch(w3: Web3, calls: Sequence[Tuple[str, list]]) -> List[Any]:
+    """Send several JSON-RPC requests in one HTTP POST and return their results in order.
 
-    Impersonation is only safe on a fork; never attempt this against real mainnet.
+    Raises ValueError if the node does not answer with a batch or any entry carries an error.
     """
-    resp = w3.provider.make_request("anvil_impersonateAccount", [impersonated])
-    if resp.get("error"):
-        sys.exit(f"RPC error during impersonation: {resp['error']}")
-
-    # Provide a small ETH balance so the impersonated account can pay gas.
-    tx = {
-        "from": funding_account,
-        "to": impersonated,
-        "value": w3.to_wei(fund_eth, "ether"),
-    }
-    w3.eth.send_transaction(tx)
-    console.print(f"[green]Impersonation successful[/green]; funded {fund_eth} ETH from {funding_account} to {impersonated}.")
-
-
-def get_usdc_index(pool: Contract, usdc_address: str) -> int:
-    for i in range(config.MAX_COINS_CHECK):
-        try:
-            coin_addr = pool.functions.coins(i).call()
-        except (BadFunctionCallOutput, ContractLogicError):
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    request_kwargs = {"timeout": 10, **w3.provider.get_request_kwargs()}
+    response = http_session.post(w3.provider.endpoint_uri, json=payload, **request_kwargs)
+    response.raise_for_status()
+    replies = response.json()
+    if not isinstance(replies, list):
+        raise ValueError(f"RPC did not return a batch response: {replies}")
+
+    by_id = {reply.get("id"): reply for reply in replies}
+    results = []
+    for i, (method, _params) in enumerate(calls):
+        reply = by_id.get(i)
+        if reply is None or reply.get("error"):
+            raise ValueError(f"Batched {method} failed: {reply and reply.get('error')}")
+        results.append(reply["result"])
+    return results
+
+
+def eth_call_request(contract: Contract, fn_name: str, *args: Any) -> Tuple[str, list]:
+    data = contract.encodeABI(fn_name=fn_name, args=list(args))
+    return "eth_call", [{"to": contract.address, "data": data}, "latest"]
+
+
+def try_aggregate(multicall: Contract, calls: Sequence[Tuple[Contract, str, list]]) -> List[Tuple[bool, bytes]]:
+    """Run several view calls through Multicall3.tryAggregate in a single eth_call.
+
+    Reverting subcalls do not abort the aggregate; they come back as (False, b"...").
+    """
+    encoded = [
+        (contract.address, contract.encodeABI(fn_name=fn_name, args=args)) for contract, fn_name, args in calls
+    ]
+    return multicall.functions.tryAggregate(False, encoded).call()
+
+
+def coin_matches(coin_result: Tuple[bool, bytes], target: bytes) -> bool:
+    """Whether a tryAggregate result for coins(i) is the 20-byte address target."""
+    success, data = coin_result
+    # An ABI-encoded address is a 32-byte word with the 20 address bytes right-aligned,
+    # so compare raw bytes instead of decoding and checksumming the coin.
+    return success and len(data) == 32 and data[12:] == target
+
+
+def match_usdc_index(coin_results: Sequence[Tuple[bool, bytes]], usdc_address: str) -> int:
+    """Return the position of USDC among tryAggregate results for coins(0..n)."""
+    target = bytes.fromhex(usdc_address[2:])
+    for i, coin_result in enumerate(coin_results):
+        # coins(i) reverts past the last coin, which marks the end of the list.
+        if not coin_result[0]:
             break
-        if Web3.to_checksum_address(coin_addr) == Web3.to_checksum_address(usdc_address):
+        if coin_matches(coin_result, target):
             return i
     sys.exit(f"Cannot find USDC in pool coins(); expected {config.USDC_ADDRESS}.")
 
 
-def read_balances(pool: Contract, usdc: Contract, address: str) -> Balances:
-    lp_balance = pool.functions.balanceOf(address).call()
-    usdc_balance = usdc.functions.balanceOf(address).call()
-    lp_decimals = pool.functions.decimals().call()
-    usdc_decimals = usdc.functions.decimals().call()
-    usdc_symbol = usdc.functions.symbol().call()
-    return Balances(
-        lp_balance=lp_balance,
-        usdc_balance=usdc_balance,
-        lp_decimals=lp_decimals,
-        usdc_decimals=usdc_decimals,
-        usdc_symbol=usdc_symbol,
+def preflight(
+    w3: Web3, multicall: Contract, pool: Contract, usdc: Contract, holder: str
+) -> Tuple[int, int, TokenMeta, Balances]:
+    """Read usdc_index, token metadata and the holder's balances in one Multicall3 eth_call.
+
+    Also returns the block number the aggregate ran against, so later reads can be
+    pinned to the same state. Cached TokenMeta is not requested again; a cached
+    usdc_index is re-checked with a single coins(i)
+    subcall in the same aggregate and rediscovered if it no longer matches.
+    """
+    cache_key = (pool.address, usdc.address)
+    calls: List[Tuple[Contract, str, list, str]] = [
+        (pool, "balanceOf", [holder], "uint256"),
+        (usdc, "balanceOf", [holder], "uint256"),
+        (multicall, "getBlockNumber", [], "uint256"),
+    ]
+    if cache_key not in _token_meta_cache:
+        calls += [
+            (pool, "decimals", [], "uint8"),
+            (usdc, "decimals", [], "uint8"),
+            (usdc, "symbol", [], "string"),
+        ]
+    cached_index = _usdc_index_cache.get(cache_key)
+    if cached_index is None:
+        coin_calls = [(pool, "coins", [i]) for i in range(config.MAX_COINS_CHECK)]
+    else:
+        coin_calls = [(pool, "coins", [cached_index])]
+
+    results = try_aggregate(multicall, [call[:3] for call in calls] + coin_calls)
+
+    values = []
+    for (contract, fn_name, _args, output_type), (success, data) in zip(calls, results):
+        if not success:
+            sys.exit(f"{fn_name}() reverted on {contract.address} during preflight.")
+        values.append(w3.codec.decode([output_type], data)[0])
+    if cache_key not in _token_meta_cache:
+        _token_meta_cache[cache_key] = TokenMeta(
+            lp_decimals=values[3],
+            usdc_decimals=values[4],
+            usdc_symbol=values[5],
+        )
+    coin_results = results[len(calls):]
+    if cached_index is None:
+        _usdc_index_cache[cache_key] = match_usdc_index(coin_results, usdc.address)
+    elif not coin_matches(coin_results[0], bytes.fromhex(usdc.address[2:])):
+        # Stale or corrupted cache entry: withdrawing at this index would pay out the wrong coin.
+        del _usdc_index_cache[cache_key]
+        return preflight(w3, multicall, pool, usdc, holder)
+
+    balances = Balances(lp_balance=values[0], usdc_balance=values[1])
+    return _usdc_index_cache[cache_key], values[2], _token_meta_cache[cache_key], balances
+
+
+def batch_eth_calls(w3: Web3, calls: Sequence[Tuple[Contract, str, list, str]]) -> List[Any]:
+    """Run single-output view calls in one JSON-RPC batch and decode each result.
+
+    Each call is (contract, fn_name, args, output_type). Falls back to sequential
+    calls if the node rejects the batch.
+    """
+    try:
+        raw = rpc_batch(w3, [eth_call_request(contract, fn_name, *args) for contract, fn_name, args, _ in calls])
+    except (ValueError, requests.RequestException):
+        return [getattr(contract.functions, fn_name)(*args).call() for contract, fn_name, args, _ in calls]
+    return [
+        w3.codec.decode([output_type], Web3.to_bytes(hexstr=result))[0]
+        for (_, _, _, output_type), result in zip(calls, raw)
+    ]
+
+
+def read_balances(w3: Web3, pool: Contract, usdc: Contract, address: str) -> Balances:
+    lp_balance, usdc_balance = batch_eth_calls(
+        w3,
+        [
+            (pool, "balanceOf", [address], "uint256"),
+            (usdc, "balanceOf", [address], "uint256"),
+        ],
     )
+    return Balances(lp_balance=lp_balance, usdc_balance=usdc_balance)
+
+
+@lru_cache(maxsize=32)
+def _pow10(exponent: int) -> int:
+    return 10**exponent
 
 
 def format_units(amount: int, decimals: int) -> str:
-    return f"{amount / (10 ** decimals):,.6f}"
+    """Format a raw token amount with 6 fractional digits using integer math only.
+
+    Rounds half up at the 6th digit, so large balances keep full precision
+    instead of passing through a float.
+    """
+    sign = "-" if amount < 0 else ""
+    micro = (abs(amount) * _pow10(6) + _pow10(decimals) // 2) // _pow10(decimals)
+    whole, frac = divmod(micro, _pow10(6))
+    return f"{sign}{whole:,}.{frac:06d}"
+
+
+@lru_cache(maxsize=32)
+def _to_shift(numerator: int, denominator: int) -> Tuple[int, int] | None:
+    """Return (n, s) with numerator/denominator == n / 2**s, or None if no exact shift exists."""
+    divisor = math.gcd(numerator, denominator)
+    n, d = numerator // divisor, denominator // divisor
+    if d & (d - 1):
+        return None
+    s = d.bit_length() - 1
+    # Equal ratios give equal floors, so this one-time check covers every amount.
+    assert n * denominator == numerator << s
+    return n, s
+
+
+def scale_ratio(amount: int, numerator: int, denominator: int) -> int:
+    """Compute amount * numerator // denominator, using a right shift instead of division when exact."""
+    shift = _to_shift(numerator, denominator)
+    if shift is None:
+        return amount * numerator // denominator
+    n, s = shift
+    return (amount * n) >> s
 
 
 def calc_burn_amount(lp_balance: int, burn_bps: int) -> int:
-    burn_amount = lp_balance * burn_bps // config.MAX_BURN_BPS
+    burn_amount = scale_ratio(lp_balance, burn_bps, config.MAX_BURN_BPS)
     if burn_amount == 0:
         sys.exit(
             "Computed burn amount is zero; LP position may be too small for the requested --burn-bps."
@@ -147,8 +349,20 @@ def calc_burn_amount(lp_balance: int, burn_bps: int) -> int:
     return burn_amount
 
 
-def estimate_usdc(pool: Contract, burn_amount: int, usdc_index: int) -> int:
-    expected = pool.functions.calc_withdraw_one_coin(burn_amount, usdc_index).call()
+def estimate_usdc(w3: Web3, pool: Contract, burn_amount: int, usdc_index: int, block: int) -> int:
+    """Estimate USDC out at a pinned block, memoizing repeats against the same state."""
+    cache_key = (pool.address, burn_amount, usdc_index, block)
+    if cache_key in _estimate_cache:
+        _estimate_cache.move_to_end(cache_key)
+    else:
+        data = config.CALC_WITHDRAW_ONE_COIN_SELECTOR + w3.codec.encode(
+            config.CALC_WITHDRAW_ONE_COIN_TYPES, [burn_amount, usdc_index]
+        )
+        result = w3.eth.call({"to": pool.address, "data": Web3.to_hex(data)}, block_identifier=block)
+        _estimate_cache[cache_key] = w3.codec.decode(["uint256"], result)[0]
+        if len(_estimate_cache) > config.ESTIMATE_CACHE_SIZE:
+            _estimate_cache.popitem(last=False)
+    expected = _estimate_cache[cache_key]
     if expected == 0:
         sys.exit("calc_withdraw_one_coin suggests 0 output; burn amount may be too small or pool is imbalanced.")
     return expected
@@ -157,48 +371,86 @@ def estimate_usdc(pool: Contract, burn_amount: int, usdc_index: int) -> int:
 def withdraw_one_coin(
     w3: Web3, pool: Contract, burn_amount: int, usdc_index: int, min_received: int, receiver: str
 ) -> Tuple[str, dict]:
-    tx_hash = pool.functions.remove_liquidity_one_coin(
-        burn_amount, usdc_index, min_received, receiver
-    ).transact({"from": receiver})
+    # Calldata is assembled from the precomputed 4-argument overload selector, which
+    # skips web3's per-call overload resolution and argument normalization.
+    data = config.REMOVE_LIQUIDITY_ONE_COIN_SELECTOR + w3.codec.encode(
+        config.REMOVE_LIQUIDITY_ONE_COIN_TYPES, [burn_amount, usdc_index, min_received, receiver]
+    )
+    tx_hash = w3.eth.send_transaction(
+        {
+            "from": receiver,
+            "to": pool.address,
+            "data": Web3.to_hex(data),
+            "gas": config.REMOVE_LIQUIDITY_GAS_LIMIT,
+        }
+    )
     receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-    if receipt.status != 1:
-        sys.exit(f"Transaction failed (status {receipt.status}). Hash: {tx_hash.hex()}")
+    if receipt["status"] != 1:
+        sys.exit(f"Transaction failed (status {receipt['status']}). Hash: {tx_hash.hex()}")
     return tx_hash.hex(), dict(receipt)
 
 
+def transfer_deltas(receipt: dict, pool_address: str, usdc_address: str, holder: str) -> Tuple[int, int]:
+    """Return (lp_burned, usdc_received) for holder from the receipt's ERC-20 Transfer logs."""
+    holder_bytes = bytes.fromhex(holder[2:])
+    lp_burned = 0
+    usdc_received = 0
+    for log in receipt["logs"]:
+        topics = log["topics"]
+        if len(topics) != 3 or topics[0] != TRANSFER_TOPIC0:
+            continue
+        # Indexed address topics are 32-byte words with the address right-aligned.
+        from_holder = topics[1][-20:] == holder_bytes
+        to_holder = topics[2][-20:] == holder_bytes
+        value = int.from_bytes(log["data"], "big")
+        if log["address"] == pool_address:
+            lp_burned += (value if from_holder else 0) - (value if to_holder else 0)
+        elif log["address"] == usdc_address:
+            usdc_received += (value if to_holder else 0) - (value if from_holder else 0)
+    return lp_burned, usdc_received
+
+
 def log_dry_run(
     rpc_url: str,
     pool_address: str,
     impersonated: str,
+    meta: TokenMeta,
     balances: Balances,
     burn_amount: int,
     usdc_index: int,
     expected_usdc: int,
     min_received: int,
 ) -> None:
-    console.print("[bold yellow]=== Dry Run: Curve USDC/crvUSD Single-Sided Withdrawal ===[/bold yellow]")
-    console.print(f"RPC URL: {rpc_url}")
-    console.print(f"Pool: {pool_address}")
-    console.print(f"Impersonated address: {impersonated}")
-    console.print()
-    console.print(f"LP balance: {format_units(balances.lp_balance, balances.lp_decimals)} LP (raw: {balances.lp_balance})")
-    console.print(f"Burn amount: {format_units(burn_amount, balances.lp_decimals)} LP (raw: {burn_amount})")
-    console.print()
-    console.print(f"USDC balance: {format_units(balances.usdc_balance, balances.usdc_decimals)} {balances.usdc_symbol} (raw: {balances.usdc_balance})")
-    console.print(f"USDC index in pool: {usdc_index}")
-    console.print(f"USDC decimals: {balances.usdc_decimals}")
-    console.print(
-        f"Expected USDC from calc_withdraw_one_coin: {format_units(expected_usdc, balances.usdc_decimals)} {balances.usdc_symbol} (raw: {expected_usdc})"
-    )
-    console.print(
-        f"Min received constraint (slippage buffer {config.SLIPPAGE_BPS}%): {format_units(min_received, balances.usdc_decimals)} {balances.usdc_symbol} (raw: {min_received})"
-    )
+    lp_balance = format_units(balances.lp_balance, meta.lp_decimals)
+    burn = format_units(burn_amount, meta.lp_decimals)
+    usdc_balance = format_units(balances.usdc_balance, meta.usdc_decimals)
+    expected = format_units(expected_usdc, meta.usdc_decimals)
+    minimum = format_units(min_received, meta.usdc_decimals)
+    symbol = meta.usdc_symbol
+    lines = [
+        "[bold yellow]=== Dry Run: Curve USDC/crvUSD Single-Sided Withdrawal ===[/bold yellow]",
+        f"RPC URL: {rpc_url}",
+        f"Pool: {pool_address}",
+        f"Impersonated address: {impersonated}",
+        "",
+        f"LP balance: {lp_balance} LP (raw: {balances.lp_balance})",
+        f"Burn amount: {burn} LP (raw: {burn_amount})",
+        "",
+        f"USDC balance: {usdc_balance} {symbol} (raw: {balances.usdc_balance})",
+        f"USDC index in pool: {usdc_index}",
+        f"USDC decimals: {meta.usdc_decimals}",
+        f"Expected USDC from calc_withdraw_one_coin: {expected} {symbol} (raw: {expected_usdc})",
+        f"Min received constraint (slippage buffer {config.SLIPPAGE_BPS}%): {minimum} {symbol} (raw: {min_received})",
+    ]
+    # One print call: rich parses markup and writes to the terminal once per report.
+    console.print("\n".join(lines), highlight=False, markup=True)
 
 
 def log_result(
     rpc_url: str,
     pool_address: str,
     impersonated: str,
+    meta: TokenMeta,
     before: Balances,
     after: Balances,
     burn_amount: int,
@@ -208,34 +460,36 @@ def log_result(
     min_received: int,
     tx_hash: str,
 ) -> None:
-    console.print("[bold green]=== Curve USDC/crvUSD Single-Sided Withdrawal ===[/bold green]")
-    console.print(f"RPC URL: {rpc_url}")
-    console.print(f"Pool: {pool_address}")
-    console.print(f"Impersonated address: {impersonated}")
-    console.print()
-    console.print(f"LP balance before: {format_units(before.lp_balance, before.lp_decimals)} LP (raw: {before.lp_balance})")
-    console.print(f"LP burned:        {format_units(lp_burned, before.lp_decimals)} LP (raw: {lp_burned})")
-    console.print(f"LP balance after: {format_units(after.lp_balance, after.lp_decimals)} LP (raw: {after.lp_balance})")
-    console.print()
-    console.print(
-        f"USDC balance before: {format_units(before.usdc_balance, before.usdc_decimals)} {before.usdc_symbol} (raw: {before.usdc_balance})"
-    )
-    console.print(
-        f"USDC balance after:  {format_units(after.usdc_balance, after.usdc_decimals)} {after.usdc_symbol} (raw: {after.usdc_balance})"
-    )
-    console.print(
-        f"USDC received:       {format_units(usdc_received, after.usdc_decimals)} {after.usdc_symbol} (raw: {usdc_received})"
-    )
-    console.print()
-    console.print(
-        f"Expected USDC from calc_withdraw_one_coin: {format_units(expected_usdc, before.usdc_decimals)} {before.usdc_symbol}"
-    )
-    console.print(
-        f"Min received constraint (slippage buffer {config.SLIPPAGE_BPS}%): {format_units(min_received, before.usdc_decimals)} {before.usdc_symbol}"
-    )
-    console.print()
-    console.print(f"Tx hash: {tx_hash}")
-    console.print("[bold green]Status: SUCCESS[/bold green]")
+    lp_before = format_units(before.lp_balance, meta.lp_decimals)
+    lp_burned_units = format_units(lp_burned, meta.lp_decimals)
+    lp_after = format_units(after.lp_balance, meta.lp_decimals)
+    usdc_before = format_units(before.usdc_balance, meta.usdc_decimals)
+    usdc_after = format_units(after.usdc_balance, meta.usdc_decimals)
+    received = format_units(usdc_received, meta.usdc_decimals)
+    expected = format_units(expected_usdc, meta.usdc_decimals)
+    minimum = format_units(min_received, meta.usdc_decimals)
+    symbol = meta.usdc_symbol
+    lines = [
+        "[bold green]=== Curve USDC/crvUSD Single-Sided Withdrawal ===[/bold green]",
+        f"RPC URL: {rpc_url}",
+        f"Pool: {pool_address}",
+        f"Impersonated address: {impersonated}",
+        "",
+        f"LP balance before: {lp_before} LP (raw: {before.lp_balance})",
+        f"LP burned:        {lp_burned_units} LP (raw: {lp_burned})",
+        f"LP balance after: {lp_after} LP (raw: {after.lp_balance})",
+        "",
+        f"USDC balance before: {usdc_before} {symbol} (raw: {before.usdc_balance})",
+        f"USDC balance after:  {usdc_after} {symbol} (raw: {after.usdc_balance})",
+        f"USDC received:       {received} {symbol} (raw: {usdc_received})",
+        "",
+        f"Expected USDC from calc_withdraw_one_coin: {expected} {symbol}",
+        f"Min received constraint (slippage buffer {config.SLIPPAGE_BPS}%): {minimum} {symbol}",
+        "",
+        f"Tx hash: {tx_hash}",
+        "[bold green]Status: SUCCESS[/bold green]",
+    ]
+    console.print("\n".join(lines), highlight=False, markup=True)
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -248,23 +502,19 @@ def main(argv: list[str] | None = None) -> None:
     pool_address = to_checksum(w3, config.POOL_ADDRESS)
     usdc_address = to_checksum(w3, config.USDC_ADDRESS)
 
-    if not w3.eth.accounts:
-        sys.exit("No local accounts found; ensure your fork tool exposes funded accounts.")
-    funding_account = w3.eth.accounts[0]
-
-    pool = w3.eth.contract(address=pool_address, abi=config.CURVE_POOL_ABI)
-    usdc = w3.eth.contract(address=usdc_address, abi=config.ERC20_ABI)
-
-    impersonate_and_fund(w3, impersonated, funding_account)
+    pool = config.get_pool_contract(w3)
+    usdc = config.get_usdc_contract(w3)
+    multicall = config.get_multicall_contract(w3)
 
-    usdc_index = get_usdc_index(pool, usdc_address)
+    impersonate_and_fund(w3, impersonated)
+    w3.eth.default_account = impersonated
 
-    balances_before = read_balances(pool, usdc, impersonated)
+    usdc_index, block, meta, balances_before = preflight(w3, multicall, pool, usdc, impersonated)
     if balances_before.lp_balance == 0:
         sys.exit(f"LP balance is zero for address {impersonated}; please select another LP holder.")
 
     burn_amount = calc_burn_amount(balances_before.lp_balance, args.burn_bps)
-    expected_usdc = estimate_usdc(pool, burn_amount, usdc_index)
+    expected_usdc = estimate_usdc(w3, pool, burn_amount, usdc_index, block)
     min_received = expected_usdc * config.SLIPPAGE_BPS // 100
 
     if args.dry_run:
@@ -272,6 +522,7 @@ def main(argv: list[str] | None = None) -> None:
             rpc_url,
             pool_address,
             impersonated,
+            meta,
             balances_before,
             burn_amount,
             usdc_index,
@@ -280,19 +531,27 @@ def main(argv: list[str] | None = None) -> None:
         )
         return
 
-    w3.eth.default_account = impersonated
-    tx_hash, _receipt = withdraw_one_coin(
+    tx_hash, receipt = withdraw_one_coin(
         w3, pool, burn_amount, usdc_index, min_received, impersonated
     )
 
-    balances_after = read_balances(pool, usdc, impersonated)
-    lp_burned = balances_before.lp_balance - balances_after.lp_balance
-    usdc_received = balances_after.usdc_balance - balances_before.usdc_balance
+    if args.verify_chain_state:
+        balances_after = read_balances(w3, pool, usdc, impersonated)
+        lp_burned = balances_before.lp_balance - balances_after.lp_balance
+        usdc_received = balances_after.usdc_balance - balances_before.usdc_balance
+    else:
+        # The receipt's Transfer events already carry both deltas; no need to query the chain again.
+        lp_burned, usdc_received = transfer_deltas(receipt, pool_address, usdc_address, impersonated)
+        balances_after = Balances(
+            lp_balance=balances_before.lp_balance - lp_burned,
+            usdc_balance=balances_before.usdc_balance + usdc_received,
+        )
 
     log_result(
         rpc_url,
         pool_address,
         impersonated,
+        meta,
         balances_before,
         balances_after,
         burn_amount,